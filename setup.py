@@ -53,7 +53,11 @@ setup(
             "isort>=5.12.0",
             "pytest-mock>=3.10.0",
             "responses>=0.23.0",
-        ]
+        ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
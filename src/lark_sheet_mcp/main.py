@@ -9,7 +9,22 @@ import sys
 from typing import Optional
 
 from .config import config_manager
-from .server import FeishuSpreadsheetMCPServer
+
+
+def _install_uvloop() -> bool:
+    """
+    Use uvloop for the server event loop when it is installed.
+
+    Returns:
+        True if the uvloop event loop policy was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 def run_server(
@@ -42,11 +57,18 @@ def run_server(
         )
         logger.info("Server ready to handle MCP requests")
 
+        # Imported here so --help and --create-config skip loading FastMCP
+        from .server import FeishuSpreadsheetMCPServer
+
         # Create and run server with FastMCP
-        server = FeishuSpreadsheetMCPServer(config.app_id, config.app_secret)
+        server = FeishuSpreadsheetMCPServer(
+            config.app_id, config.app_secret, timeout=config.timeout
+        )
         mcp = server.get_mcp_server()
 
         # Run the FastMCP server with stdio transport
+        if _install_uvloop():
+            logger.info("Using uvloop event loop")
         mcp.run("stdio")
 
     except Exception as e:
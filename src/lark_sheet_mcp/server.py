@@ -6,7 +6,6 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from fastmcp import FastMCP
-from pydantic import BaseModel
 
 from .services import AuthenticationManager, FeishuAPIClient
 from .tools import spreadsheet_tools
@@ -14,55 +13,24 @@ from .tools import spreadsheet_tools
 logger = logging.getLogger(__name__)
 
 
-class ListSpreadsheetsArgs(BaseModel):
-    folder_token: Optional[str] = None
-    page_size: int = 50
-
-
-class GetWorksheetsArgs(BaseModel):
-    spreadsheet_token: str
-
-
-class ReadRangeArgs(BaseModel):
-    spreadsheet_token: str
-    range_spec: str
-    value_render_option: str = "UnformattedValue"
-    date_time_render_option: str = "FormattedString"
-
-
-class ReadMultipleRangesArgs(BaseModel):
-    spreadsheet_token: str
-    ranges: List[str]
-    value_render_option: str = "UnformattedValue"
-    date_time_render_option: str = "FormattedString"
-
-
-class FindCellsArgs(BaseModel):
-    spreadsheet_token: str
-    sheet_id: str
-    range_spec: str
-    find_text: str
-    match_case: bool = False
-    match_entire_cell: bool = False
-    search_by_regex: bool = False
-    include_formulas: bool = False
-
-
 class FeishuSpreadsheetMCPServer:
     """飞书电子表格MCP服务器主类"""
 
-    def __init__(self, app_id: str, app_secret: str):
+    def __init__(self, app_id: str, app_secret: str, timeout: float = 30.0):
         """
         Initialize MCP server.
 
         Args:
             app_id: Feishu app ID
             app_secret: Feishu app secret
+            timeout: Request timeout in seconds for Feishu API calls
         """
         self.app_id = app_id
         self.app_secret = app_secret
-        self.auth_manager = AuthenticationManager(app_id, app_secret)
-        self.api_client = FeishuAPIClient(self.auth_manager)
+        self.auth_manager = AuthenticationManager(
+            app_id, app_secret, timeout=timeout
+        )
+        self.api_client = FeishuAPIClient(self.auth_manager, timeout=timeout)
 
         # Initialize FastMCP
         self.mcp = FastMCP("feishu-spreadsheet-mcp")
@@ -238,3 +206,4 @@ class FeishuSpreadsheetMCPServer:
     async def close(self):
         """关闭服务器和清理资源"""
         await self.api_client.close()
+        await self.auth_manager.close()
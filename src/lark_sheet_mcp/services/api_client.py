@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 import time
+from types import ModuleType
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
@@ -19,9 +20,29 @@ from ..models.error_handling import (
 )
 from .auth_manager import AuthenticationManager
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(data: Any) -> Any:
+    """Encode a request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data)
+
+
+def _json_loads(text: str) -> Any:
+    """Decode a response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 class RateLimiter:
     """API调用频率限制器"""
 
@@ -42,6 +63,10 @@ class RateLimiter:
         """
         Acquire permission to make a request.
         Blocks if rate limit would be exceeded.
+
+        The slot is reserved while holding the lock and the wait happens
+        after releasing it, so concurrent callers queue up in order instead
+        of serializing behind a sleeping holder.
         """
         async with self._lock:
             now = time.time()
@@ -55,20 +80,19 @@ class RateLimiter:
 
             # Check if we can make a request
             if len(self.requests) >= self.max_requests:
-                # Calculate how long to wait
-                oldest_request = min(self.requests)
-                wait_time = self.time_window - (now - oldest_request)
-
-                if wait_time > 0:
-                    logger.info("Rate limit reached, waiting %.2f seconds", wait_time)
-                    await asyncio.sleep(wait_time)
-
-                    # Retry after waiting
-                    await self.acquire()
-                    return
+                # Reserve the slot freed when the request max_requests
+                # positions back leaves the time window
+                slot_time = self.requests[-self.max_requests] + self.time_window
+            else:
+                slot_time = now
 
             # Record this request
-            self.requests.append(now)
+            self.requests.append(slot_time)
+
+        wait_time = slot_time - now
+        if wait_time > 0:
+            logger.info("Rate limit reached, waiting %.2f seconds", wait_time)
+            await asyncio.sleep(wait_time)
 
     def get_current_usage(self) -> Dict[str, Any]:
         """
@@ -98,6 +122,7 @@ class FeishuAPIClient:
         auth_manager: AuthenticationManager,
         rate_limiter: Optional[RateLimiter] = None,
         retry_strategy: Optional[RetryStrategy] = None,
+        timeout: float = 30.0,
     ):
         """
         Initialize Feishu API client.
@@ -106,19 +131,18 @@ class FeishuAPIClient:
             auth_manager: Authentication manager instance
             rate_limiter: Rate limiter instance, creates default if None
             retry_strategy: Retry strategy instance, uses default if None
+            timeout: Total timeout in seconds for a single HTTP request
         """
         self.auth_manager = auth_manager
         self.base_url = "https://open.feishu.cn/open-apis"
         self.session: Optional[aiohttp.ClientSession] = None
         self.rate_limiter = rate_limiter or RateLimiter()
         self.retry_strategy = retry_strategy or DEFAULT_RETRY_STRATEGY
+        self.timeout = timeout
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            connector=aiohttp.TCPConnector(limit=100, limit_per_host=30),
-        )
+        self.session = self._create_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -127,23 +151,49 @@ class FeishuAPIClient:
             await self.session.close()
             self.session = None
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the HTTP session shared by all API calls.
+
+        Idle connections to open.feishu.cn are kept alive between tool calls
+        and page fetches, and DNS results are cached, so consecutive requests
+        skip the TCP/TLS handshake and the lookup.
+        """
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=30,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            ),
+        )
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self.session is None:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                connector=aiohttp.TCPConnector(limit=100, limit_per_host=30),
-            )
+            self.session = self._create_session()
         return self.session
 
+    async def _get_access_token(self) -> str:
+        """Get the current tenant access token, logging failures."""
+        try:
+            return await self.auth_manager.get_tenant_access_token()
+        except Exception as e:
+            logger.error(f"Failed to get authentication token: {e}")
+            raise
+
     async def _prepare_headers(
-        self, additional_headers: Optional[Dict[str, str]] = None
+        self,
+        additional_headers: Optional[Dict[str, str]] = None,
+        access_token: Optional[str] = None,
     ) -> Dict[str, str]:
         """
         Prepare HTTP headers with authentication token.
 
         Args:
             additional_headers: Additional headers to include
+            access_token: Token to send, fetched from the auth manager if None
 
         Returns:
             Complete headers dictionary with authentication
@@ -154,12 +204,9 @@ class FeishuAPIClient:
         }
 
         # Add authentication token
-        try:
-            token = await self.auth_manager.get_tenant_access_token()
-            headers["Authorization"] = f"Bearer {token}"
-        except Exception as e:
-            logger.error(f"Failed to get authentication token: {e}")
-            raise
+        if access_token is None:
+            access_token = await self._get_access_token()
+        headers["Authorization"] = f"Bearer {access_token}"
 
         # Add any additional headers
         if additional_headers:
@@ -198,9 +245,13 @@ class FeishuAPIClient:
                 # Apply rate limiting
                 await self.rate_limiter.acquire()
 
+                # Fetch the token here so an auth failure can report exactly
+                # which token the server rejected
+                token = await self._get_access_token()
+
                 # Make the actual request
                 return await self._make_request(
-                    method, endpoint, params, data, additional_headers
+                    method, endpoint, params, data, additional_headers, token
                 )
 
             except FeishuAPIError as e:
@@ -217,7 +268,7 @@ class FeishuAPIClient:
                 if ErrorCodeMapping.needs_auth_refresh(e.code):
                     logger.info("Refreshing authentication token due to auth error")
                     try:
-                        await self.auth_manager.refresh_token()
+                        await self.auth_manager.refresh_token(rejected_token=token)
                     except Exception as auth_error:
                         logger.error("Failed to refresh token: %s", auth_error)
                         # Continue with retry anyway
@@ -247,6 +298,7 @@ class FeishuAPIClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         additional_headers: Optional[Dict[str, str]] = None,
+        access_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Make HTTP request to Feishu API.
@@ -257,6 +309,7 @@ class FeishuAPIClient:
             params: Query parameters
             data: Request body data
             additional_headers: Additional headers
+            access_token: Token to send, fetched from the auth manager if None
 
         Returns:
             API response data
@@ -265,7 +318,7 @@ class FeishuAPIClient:
             FeishuAPIError: If API request fails
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = await self._prepare_headers(additional_headers)
+        headers = await self._prepare_headers(additional_headers, access_token)
         session = await self._get_session()
 
         # Log request details
@@ -280,7 +333,7 @@ class FeishuAPIClient:
             request_kwargs = {"headers": headers, "params": params}
 
             if data is not None:
-                request_kwargs["data"] = json.dumps(data)
+                request_kwargs["data"] = _json_dumps(data)
 
             async with session.request(method, url, **request_kwargs) as response:
                 response_text = await response.text()
@@ -292,8 +345,8 @@ class FeishuAPIClient:
 
                 # Parse JSON response
                 try:
-                    response_data = json.loads(response_text) if response_text else {}
-                except json.JSONDecodeError as e:
+                    response_data = _json_loads(response_text) if response_text else {}
+                except ValueError as e:
                     logger.error(f"Failed to parse JSON response: {e}")
                     raise FeishuAPIError(
                         code=-2,
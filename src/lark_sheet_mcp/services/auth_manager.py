@@ -22,7 +22,11 @@ class AuthenticationManager:
     """飞书API认证管理器"""
 
     def __init__(
-        self, app_id: str, app_secret: str, retry_config: Optional[RetryConfig] = None
+        self,
+        app_id: str,
+        app_secret: str,
+        retry_config: Optional[RetryConfig] = None,
+        timeout: float = 30.0,
     ):
         """
         Initialize authentication manager.
@@ -31,11 +35,14 @@ class AuthenticationManager:
             app_id: Feishu app ID
             app_secret: Feishu app secret
             retry_config: Optional retry configuration for authentication failures
+            timeout: Total timeout in seconds for a single token request
         """
         self.app_id = app_id
         self.app_secret = app_secret
+        self.timeout = timeout
         self.tenant_access_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
+        self.session: Optional[aiohttp.ClientSession] = None
         self._lock = asyncio.Lock()
         self.retry_strategy = RetryStrategy(retry_config or RetryConfig(max_retries=2))
 
@@ -49,6 +56,16 @@ class AuthenticationManager:
         Raises:
             AuthenticationError: If token cannot be obtained
         """
+        # Fast path: a valid token needs no lock unless a refresh is running,
+        # in which case the token may just have been rejected by the server
+        token = self.tenant_access_token
+        if (
+            token is not None
+            and not self._lock.locked()
+            and not self._is_token_expired()
+        ):
+            return token
+
         async with self._lock:
             if self._is_token_expired():
                 try:
@@ -59,14 +76,26 @@ class AuthenticationManager:
                     ) from e
             return self.tenant_access_token
 
-    async def refresh_token(self) -> None:
+    async def refresh_token(self, rejected_token: Optional[str] = None) -> None:
         """
         Public method to force token refresh.
 
+        If the current token already differs from the rejected one and is
+        still valid, another caller has refreshed it and no request is made.
+
+        Args:
+            rejected_token: Token the server rejected; defaults to the token
+                current at call time
+
         Raises:
             AuthenticationError: If token cannot be refreshed
         """
+        stale_token = rejected_token
+        if stale_token is None:
+            stale_token = self.tenant_access_token
         async with self._lock:
+            if self.tenant_access_token != stale_token and not self._is_token_expired():
+                return
             try:
                 await self._refresh_token()
             except FeishuAPIError as e:
@@ -120,57 +149,55 @@ class AuthenticationManager:
         url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
         headers = {"Content-Type": "application/json"}
         data = {"app_id": self.app_id, "app_secret": self.app_secret}
+        session = await self._get_session()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    headers=headers,
-                    data=json.dumps(data),
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    response_data = await response.json()
-
-                    if response.status != 200:
-                        raise FeishuAPIError(
-                            code=response.status,
-                            message=f"HTTP {response.status}: {response_data.get('msg', 'Unknown error')}",
-                            http_status=response.status,
-                        )
-
-                    if response_data.get("code") != 0:
-                        error_code = response_data.get("code", -1)
-                        error_message = response_data.get("msg", "Unknown error")
-
-                        # Use user-friendly message if available
-                        friendly_message = ErrorCodeMapping.get_user_friendly_message(
-                            error_code, error_message
-                        )
-
-                        raise FeishuAPIError(
-                            code=error_code,
-                            message=friendly_message,
-                            http_status=response.status,
-                        )
-
-                    # Extract token and expiration
-                    self.tenant_access_token = response_data.get("tenant_access_token")
-                    expire_seconds = response_data.get(
-                        "expire", 7200
-                    )  # Default 2 hours
-
-                    if not self.tenant_access_token:
-                        raise FeishuAPIError(
-                            code=-1,
-                            message="No tenant_access_token in response",
-                            http_status=response.status,
-                        )
-
-                    # Set expiration time
-                    self.token_expires_at = datetime.now() + timedelta(
-                        seconds=expire_seconds
+            async with session.post(
+                url,
+                headers=headers,
+                data=json.dumps(data),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                response_data = await response.json()
+
+                if response.status != 200:
+                    raise FeishuAPIError(
+                        code=response.status,
+                        message=f"HTTP {response.status}: {response_data.get('msg', 'Unknown error')}",
+                        http_status=response.status,
+                    )
+
+                if response_data.get("code") != 0:
+                    error_code = response_data.get("code", -1)
+                    error_message = response_data.get("msg", "Unknown error")
+
+                    # Use user-friendly message if available
+                    friendly_message = ErrorCodeMapping.get_user_friendly_message(
+                        error_code, error_message
                     )
 
+                    raise FeishuAPIError(
+                        code=error_code,
+                        message=friendly_message,
+                        http_status=response.status,
+                    )
+
+                # Extract token and expiration
+                self.tenant_access_token = response_data.get("tenant_access_token")
+                expire_seconds = response_data.get("expire", 7200)  # Default 2 hours
+
+                if not self.tenant_access_token:
+                    raise FeishuAPIError(
+                        code=-1,
+                        message="No tenant_access_token in response",
+                        http_status=response.status,
+                    )
+
+                # Set expiration time
+                self.token_expires_at = datetime.now() + timedelta(
+                    seconds=expire_seconds
+                )
+
         except aiohttp.ClientError as e:
             # Network errors are typically retryable
             raise FeishuAPIError(
@@ -184,6 +211,18 @@ class AuthenticationManager:
                 http_status=response.status if "response" in locals() else 0,
             ) from e
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create HTTP session reused across token refreshes."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+
     def _is_token_expired(self) -> bool:
         """
         检查token是否过期
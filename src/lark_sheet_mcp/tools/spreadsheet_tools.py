@@ -2,15 +2,71 @@
 MCP tools for spreadsheet operations.
 """
 
-from typing import List, Optional, Tuple
-
-from ..models import FindResult, RangeData, SpreadsheetInfo, WorksheetInfo
+import asyncio
+import logging
+import re
+import traceback
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Tuple
+
+from ..models import (
+    FeishuAPIError,
+    FindResult,
+    RangeData,
+    SpreadsheetInfo,
+    WorksheetInfo,
+    validate_range_spec,
+)
+
+if TYPE_CHECKING:
+    from ..services import FeishuAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Accepted render options, in the order shown in validation errors
+VALUE_RENDER_OPTIONS = ("ToString", "Formula", "FormattedValue", "UnformattedValue")
+DATE_TIME_RENDER_OPTIONS = ("FormattedString",)
+
+# Upper bound on in-flight read_range calls issued by read_multiple_ranges
+MAX_CONCURRENT_RANGE_READS = 8
+
+# User-friendly messages for Feishu API error codes, per tool
+_AUTH_ERROR_MESSAGE = "认证失败。请检查app_id和app_secret配置。"
+_SPREADSHEET_NOT_FOUND_MESSAGE = "指定的电子表格不存在。请检查spreadsheet_token是否正确。"
+_NO_READ_PERMISSION_MESSAGE = "没有读取权限。请检查电子表格权限设置或联系文档所有者。"
+
+_LIST_SPREADSHEETS_ERRORS: Dict[int, str] = {
+    1061004: "没有访问权限。请检查文档权限设置或联系文档所有者。",
+}
+_GET_WORKSHEETS_ERRORS: Dict[int, str] = {
+    1310214: _SPREADSHEET_NOT_FOUND_MESSAGE,
+    1310213: _NO_READ_PERMISSION_MESSAGE,
+}
+_READ_RANGE_ERRORS: Dict[int, str] = {
+    1310214: _SPREADSHEET_NOT_FOUND_MESSAGE,
+    1310215: "指定的工作表不存在。请检查range_spec中的工作表ID是否正确。",
+    1310213: _NO_READ_PERMISSION_MESSAGE,
+    1310216: "范围格式无效。请使用正确的格式，如 'sheetId!A1:B10'。",
+    1310218: "返回数据超过10MB限制。请缩小查询范围。",
+}
+_READ_MULTIPLE_RANGES_ERRORS: Dict[int, str] = {
+    1310214: _SPREADSHEET_NOT_FOUND_MESSAGE,
+    1310215: "指定的工作表不存在。请检查ranges中的工作表ID是否正确。",
+    1310213: _NO_READ_PERMISSION_MESSAGE,
+    1310216: "范围格式无效。请使用正确的格式，如 'sheetId!A1:B10'。",
+    1310218: "返回数据超过10MB限制。请减少查询范围的数量或大小。",
+}
+_FIND_CELLS_ERRORS: Dict[int, str] = {
+    1310214: _SPREADSHEET_NOT_FOUND_MESSAGE,
+    1310215: "指定的工作表不存在。请检查sheet_id是否正确。",
+    1310213: _NO_READ_PERMISSION_MESSAGE,
+    1310216: "范围格式无效。请使用正确的格式，如 'A1:B10'。",
+    1310219: "正则表达式格式无效。请检查正则表达式语法。",
+}
 
 
 def _parse_cell_position(cell_ref: str) -> Tuple[int, int]:
     """Parse cell reference like 'A1' to (column_index, row_index) (0-based)"""
-    import re
-    
     match = re.match(r'^([A-Z]+)(\d+)$', cell_ref.upper())
     if not match:
         raise ValueError(f"Invalid cell reference: {cell_ref}")
@@ -45,6 +101,67 @@ def _position_to_cell_ref(col_index: int, row_index: int) -> str:
     return col_str + row_str
 
 
+def _friendly_error_message(
+    error: FeishuAPIError, messages: Dict[int, str]
+) -> Optional[str]:
+    """Look up the user-facing message for an API error, if there is one"""
+    message = messages.get(error.code)
+    if message is None and error.is_authentication_error():
+        message = _AUTH_ERROR_MESSAGE
+    return message
+
+
+def _reraise_with_friendly_message(
+    error: FeishuAPIError, messages: Dict[int, str]
+) -> NoReturn:
+    """Re-raise an API error, swapping in a user-facing message when known"""
+    message = _friendly_error_message(error, messages)
+    if message is None:
+        raise error
+    raise FeishuAPIError(
+        code=error.code, message=message, http_status=error.http_status
+    ) from error
+
+
+@lru_cache(maxsize=128)
+def _compile_search_pattern(find_text: str, match_case: bool) -> "re.Pattern[str]":
+    """Compile and validate a find_cells regex once per (pattern, case) pair"""
+    return re.compile(find_text, 0 if match_case else re.IGNORECASE)
+
+
+async def _read_value_range(
+    api_client: "FeishuAPIClient",
+    spreadsheet_token: str,
+    range_spec: str,
+    value_render_option: str,
+    date_time_render_option: str,
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Read one range, falling back to an empty placeholder on failure"""
+    try:
+        async with semaphore:
+            single_response = await api_client.read_range(
+                spreadsheet_token=spreadsheet_token,
+                range_spec=range_spec,
+                value_render_option=value_render_option,
+                date_time_render_option=date_time_render_option,
+            )
+        # Extract the valueRange from single response
+        value_range: Dict[str, Any] = single_response.get("data", {}).get(
+            "valueRange", {}
+        )
+        return value_range
+    except Exception as e:
+        logger.warning(f"Failed to read range {range_spec}: {e}")
+        # Add empty range as placeholder
+        return {
+            "range": range_spec,
+            "majorDimension": "ROWS",
+            "values": [],
+            "revision": 0,
+        }
+
+
 async def list_spreadsheets(
     api_client, folder_token: Optional[str] = None, page_size: int = 50
 ) -> dict:
@@ -59,8 +176,6 @@ async def list_spreadsheets(
     Returns:
         电子表格信息列表
     """
-    from ..models.data_models import FeishuAPIError
-
     # Validate page_size
     if not isinstance(page_size, int) or page_size <= 0:
         raise ValueError("page_size must be a positive integer")
@@ -77,8 +192,11 @@ async def list_spreadsheets(
             folder_token = None
 
     try:
-        spreadsheets = []
+        spreadsheets: List[SpreadsheetInfo] = []
         page_token = None
+        # Bound once; the filter loop below runs for every file in the folder
+        append_spreadsheet = spreadsheets.append
+        spreadsheet_from_api = SpreadsheetInfo.from_api_response
 
         # Handle pagination
         while True:
@@ -94,17 +212,13 @@ async def list_spreadsheets(
 
             # Filter for spreadsheets (type="sheet")
             for file_data in files:
-                if file_data.get("type") == "sheet":
-                    try:
-                        spreadsheet = SpreadsheetInfo.from_api_response(file_data)
-                        spreadsheets.append(spreadsheet)
-                    except ValueError as e:
-                        # Log invalid data but continue processing
-                        import logging
-
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"Skipping invalid spreadsheet data: {e}")
-                        continue
+                if file_data.get("type") != "sheet":
+                    continue
+                try:
+                    append_spreadsheet(spreadsheet_from_api(file_data))
+                except ValueError as e:
+                    # Log invalid data but continue processing
+                    logger.warning(f"Skipping invalid spreadsheet data: {e}")
 
             # Check for next page
             page_token = response.get("data", {}).get("page_token")
@@ -130,22 +244,7 @@ async def list_spreadsheets(
             "total_count": len(spreadsheet_dicts),
         }
     except FeishuAPIError as e:
-        # Handle specific API errors with user-friendly messages
-        if e.code == 1061004:  # Permission error
-            raise FeishuAPIError(
-                code=e.code,
-                message="没有访问权限。请检查文档权限设置或联系文档所有者。",
-                http_status=e.http_status,
-            ) from e
-        elif e.is_authentication_error():
-            raise FeishuAPIError(
-                code=e.code,
-                message="认证失败。请检查app_id和app_secret配置。",
-                http_status=e.http_status,
-            ) from e
-        else:
-            # Re-raise other API errors as-is
-            raise
+        _reraise_with_friendly_message(e, _LIST_SPREADSHEETS_ERRORS)
     except Exception as e:
         # Wrap unexpected errors
         raise FeishuAPIError(
@@ -164,8 +263,6 @@ async def get_worksheets(api_client, spreadsheet_token: str) -> dict:
     Returns:
         工作表信息列表
     """
-    from ..models.data_models import FeishuAPIError
-
     # Validate spreadsheet_token
     if not spreadsheet_token or not isinstance(spreadsheet_token, str):
         raise ValueError("spreadsheet_token must be a non-empty string")
@@ -180,18 +277,15 @@ async def get_worksheets(api_client, spreadsheet_token: str) -> dict:
         # Extract worksheets from response
         worksheets_data = response.get("data", {}).get("sheets", [])
 
-        worksheets = []
+        worksheets: List[WorksheetInfo] = []
+        append_worksheet = worksheets.append
+        worksheet_from_api = WorksheetInfo.from_api_response
         for worksheet_data in worksheets_data:
             try:
-                worksheet = WorksheetInfo.from_api_response(worksheet_data)
-                worksheets.append(worksheet)
+                append_worksheet(worksheet_from_api(worksheet_data))
             except ValueError as e:
                 # Log invalid data but continue processing
-                import logging
-
-                logger = logging.getLogger(__name__)
                 logger.warning(f"Skipping invalid worksheet data: {e}")
-                continue
 
         # Convert to dictionary format for FastMCP compatibility
         worksheet_dicts = []
@@ -213,28 +307,7 @@ async def get_worksheets(api_client, spreadsheet_token: str) -> dict:
         return {"worksheets": worksheet_dicts, "total_count": len(worksheet_dicts)}
 
     except FeishuAPIError as e:
-        # Handle specific API errors with user-friendly messages
-        if e.code == 1310214:  # Spreadsheet not found
-            raise FeishuAPIError(
-                code=e.code,
-                message="指定的电子表格不存在。请检查spreadsheet_token是否正确。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310213:  # Permission error
-            raise FeishuAPIError(
-                code=e.code,
-                message="没有读取权限。请检查电子表格权限设置或联系文档所有者。",
-                http_status=e.http_status,
-            ) from e
-        elif e.is_authentication_error():
-            raise FeishuAPIError(
-                code=e.code,
-                message="认证失败。请检查app_id和app_secret配置。",
-                http_status=e.http_status,
-            ) from e
-        else:
-            # Re-raise other API errors as-is
-            raise
+        _reraise_with_friendly_message(e, _GET_WORKSHEETS_ERRORS)
     except Exception as e:
         # Wrap unexpected errors
         raise FeishuAPIError(
@@ -262,8 +335,6 @@ async def read_range(
     Returns:
         范围数据
     """
-    from ..models.data_models import FeishuAPIError, validate_range_spec
-
     # Validate parameters
     if not spreadsheet_token or not isinstance(spreadsheet_token, str):
         raise ValueError("spreadsheet_token must be a non-empty string")
@@ -275,15 +346,15 @@ async def read_range(
     range_spec = validate_range_spec(range_spec)
 
     # Validate value render option
-    valid_value_options = ["ToString", "Formula", "FormattedValue", "UnformattedValue"]
-    if value_render_option not in valid_value_options:
-        raise ValueError(f"value_render_option must be one of {valid_value_options}")
+    if value_render_option not in VALUE_RENDER_OPTIONS:
+        raise ValueError(
+            f"value_render_option must be one of {list(VALUE_RENDER_OPTIONS)}"
+        )
 
     # Validate date time render option
-    valid_datetime_options = ["FormattedString"]
-    if date_time_render_option not in valid_datetime_options:
+    if date_time_render_option not in DATE_TIME_RENDER_OPTIONS:
         raise ValueError(
-            f"date_time_render_option must be one of {valid_datetime_options}"
+            f"date_time_render_option must be one of {list(DATE_TIME_RENDER_OPTIONS)}"
         )
 
     try:
@@ -310,46 +381,7 @@ async def read_range(
         }
 
     except FeishuAPIError as e:
-        # Handle specific API errors with user-friendly messages
-        if e.code == 1310214:  # Spreadsheet not found
-            raise FeishuAPIError(
-                code=e.code,
-                message="指定的电子表格不存在。请检查spreadsheet_token是否正确。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310215:  # Sheet not found
-            raise FeishuAPIError(
-                code=e.code,
-                message="指定的工作表不存在。请检查range_spec中的工作表ID是否正确。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310213:  # Permission error
-            raise FeishuAPIError(
-                code=e.code,
-                message="没有读取权限。请检查电子表格权限设置或联系文档所有者。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310216:  # Range format error
-            raise FeishuAPIError(
-                code=e.code,
-                message="范围格式无效。请使用正确的格式，如 'sheetId!A1:B10'。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310218:  # Data size limit exceeded
-            raise FeishuAPIError(
-                code=e.code,
-                message="返回数据超过10MB限制。请缩小查询范围。",
-                http_status=e.http_status,
-            ) from e
-        elif e.is_authentication_error():
-            raise FeishuAPIError(
-                code=e.code,
-                message="认证失败。请检查app_id和app_secret配置。",
-                http_status=e.http_status,
-            ) from e
-        else:
-            # Re-raise other API errors as-is
-            raise
+        _reraise_with_friendly_message(e, _READ_RANGE_ERRORS)
     except Exception as e:
         # Wrap unexpected errors
         raise FeishuAPIError(
@@ -377,8 +409,6 @@ async def read_multiple_ranges(
     Returns:
         多个范围的数据列表
     """
-    from ..models.data_models import FeishuAPIError, validate_range_spec
-
     # Validate parameters
     if not spreadsheet_token or not isinstance(spreadsheet_token, str):
         raise ValueError("spreadsheet_token must be a non-empty string")
@@ -404,130 +434,72 @@ async def read_multiple_ranges(
             raise ValueError(f"Invalid range at index {i}: {e}")
 
     # Validate value render option
-    valid_value_options = ["ToString", "Formula", "FormattedValue", "UnformattedValue"]
-    if value_render_option not in valid_value_options:
-        raise ValueError(f"value_render_option must be one of {valid_value_options}")
+    if value_render_option not in VALUE_RENDER_OPTIONS:
+        raise ValueError(
+            f"value_render_option must be one of {list(VALUE_RENDER_OPTIONS)}"
+        )
 
     # Validate date time render option
-    valid_datetime_options = ["FormattedString"]
-    if date_time_render_option not in valid_datetime_options:
+    if date_time_render_option not in DATE_TIME_RENDER_OPTIONS:
         raise ValueError(
-            f"date_time_render_option must be one of {valid_datetime_options}"
+            f"date_time_render_option must be one of {list(DATE_TIME_RENDER_OPTIONS)}"
         )
 
     try:
         # Fallback implementation: use multiple single read_range calls
         # This works around API issues with the batch endpoint
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("Using fallback implementation for read_multiple_ranges")
         
-        value_ranges = []
-        for range_spec in validated_ranges:
-            try:
-                single_response = await api_client.read_range(
-                    spreadsheet_token=spreadsheet_token,
-                    range_spec=range_spec,
-                    value_render_option=value_render_option,
-                    date_time_render_option=date_time_render_option,
+        # Ranges are independent, so issue the reads concurrently (bounded)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RANGE_READS)
+        value_ranges = await asyncio.gather(
+            *(
+                _read_value_range(
+                    api_client,
+                    spreadsheet_token,
+                    range_spec,
+                    value_render_option,
+                    date_time_render_option,
+                    semaphore,
                 )
-                # Extract the valueRange from single response
-                single_range = single_response.get("data", {}).get("valueRange", {})
-                value_ranges.append(single_range)
-            except Exception as e:
-                logger.warning(f"Failed to read range {range_spec}: {e}")
-                # Add empty range as placeholder
-                empty_range = {
-                    "range": range_spec,
-                    "majorDimension": "ROWS", 
-                    "values": [],
-                    "revision": 0
-                }
-                value_ranges.append(empty_range)
-
-        results = []
+                for range_spec in validated_ranges
+            )
+        )
+
+        # Convert each range straight to its dictionary form in one pass
+        range_dicts: List[Dict[str, Any]] = []
+        append_range = range_dicts.append
+        range_from_api = RangeData.from_api_response
         for i, range_data in enumerate(value_ranges):
             try:
-                result = RangeData.from_api_response(range_data)
-                results.append(result)
+                result = range_from_api(range_data)
+                append_range(
+                    {
+                        "range": result.range,
+                        "major_dimension": result.major_dimension,
+                        "values": result.values,
+                        "revision": result.revision,
+                        "is_empty": result.is_empty(),
+                    }
+                )
             except ValueError as e:
                 # Log invalid data but continue processing
-                import logging
-
-                logger = logging.getLogger(__name__)
                 logger.warning(f"Skipping invalid range data at index {i}: {e}")
                 # Add empty range data as placeholder
-                empty_range = {
-                    "range": (
-                        validated_ranges[i]
-                        if i < len(validated_ranges)
-                        else f"unknown_range_{i}"
-                    ),
-                    "major_dimension": "ROWS",
-                    "values": [],
-                    "revision": 0,
-                    "is_empty": True,
-                }
-                results.append(empty_range)
-
-        # Convert results to dictionary format
-        range_dicts = []
-        for result in results:
-            if isinstance(result, RangeData):
-                range_dict = {
-                    "range": result.range,
-                    "major_dimension": result.major_dimension,
-                    "values": result.values,
-                    "revision": result.revision,
-                    "is_empty": result.is_empty(),
-                }
-            else:
-                range_dict = result  # Already a dict (empty range)
-            range_dicts.append(range_dict)
+                append_range(
+                    {
+                        "range": validated_ranges[i],
+                        "major_dimension": "ROWS",
+                        "values": [],
+                        "revision": 0,
+                        "is_empty": True,
+                    }
+                )
 
         return {"ranges": range_dicts, "total_count": len(range_dicts)}
 
     except FeishuAPIError as e:
-        # Handle specific API errors with user-friendly messages
-        if e.code == 1310214:  # Spreadsheet not found
-            raise FeishuAPIError(
-                code=e.code,
-                message="指定的电子表格不存在。请检查spreadsheet_token是否正确。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310215:  # Sheet not found
-            raise FeishuAPIError(
-                code=e.code,
-                message="指定的工作表不存在。请检查ranges中的工作表ID是否正确。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310213:  # Permission error
-            raise FeishuAPIError(
-                code=e.code,
-                message="没有读取权限。请检查电子表格权限设置或联系文档所有者。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310216:  # Range format error
-            raise FeishuAPIError(
-                code=e.code,
-                message="范围格式无效。请使用正确的格式，如 'sheetId!A1:B10'。",
-                http_status=e.http_status,
-            ) from e
-        elif e.code == 1310218:  # Data size limit exceeded
-            raise FeishuAPIError(
-                code=e.code,
-                message="返回数据超过10MB限制。请减少查询范围的数量或大小。",
-                http_status=e.http_status,
-            ) from e
-        elif e.is_authentication_error():
-            raise FeishuAPIError(
-                code=e.code,
-                message="认证失败。请检查app_id和app_secret配置。",
-                http_status=e.http_status,
-            ) from e
-        else:
-            # Re-raise other API errors as-is
-            raise
+        _reraise_with_friendly_message(e, _READ_MULTIPLE_RANGES_ERRORS)
     except Exception as e:
         # Wrap unexpected errors
         raise FeishuAPIError(
@@ -563,10 +535,6 @@ async def find_cells(
     Returns:
         查找结果
     """
-    import re
-
-    from ..models.data_models import FeishuAPIError
-
     # Validate parameters
     if not spreadsheet_token or not isinstance(spreadsheet_token, str):
         raise ValueError("spreadsheet_token must be a non-empty string")
@@ -602,20 +570,18 @@ async def find_cells(
     if not isinstance(include_formulas, bool):
         raise ValueError("include_formulas must be a boolean")
 
-    # Validate regex pattern if search_by_regex is True
+    # Validate regex pattern if search_by_regex is True; the compiled pattern
+    # is cached and reused for the search below
+    pattern: Optional["re.Pattern[str]"] = None
     if search_by_regex:
         try:
-            re.compile(find_text)
+            pattern = _compile_search_pattern(find_text, match_case)
         except re.error as e:
             raise ValueError(f"Invalid regular expression: {e}")
 
     try:
         # Fallback implementation: read data and search locally
         # This avoids the API issues with find_cells endpoint
-        import logging
-        import re
-
-        logger = logging.getLogger(__name__)
         logger.debug(
             f"Using local search fallback for: spreadsheet_token={spreadsheet_token}, sheet_id={sheet_id}, range_spec={range_spec}, find_text={find_text}"
         )
@@ -652,14 +618,9 @@ async def find_cells(
                     cell_str = str(cell_value)
                     found = False
 
-                    if search_by_regex:
+                    if pattern is not None:
                         # Use regex search
-                        try:
-                            pattern = re.compile(find_text, re.IGNORECASE if not match_case else 0)
-                            found = bool(pattern.search(cell_str))
-                        except re.error:
-                            # Invalid regex, skip
-                            continue
+                        found = bool(pattern.search(cell_str))
                     else:
                         # String search
                         search_text = find_text if match_case else find_text.lower()
@@ -688,22 +649,7 @@ async def find_cells(
         }
 
     except FeishuAPIError as e:
-        # Handle specific API errors with user-friendly messages and return error dict instead of raising
-        error_message = ""
-        if e.code == 1310214:  # Spreadsheet not found
-            error_message = "指定的电子表格不存在。请检查spreadsheet_token是否正确。"
-        elif e.code == 1310215:  # Sheet not found
-            error_message = "指定的工作表不存在。请检查sheet_id是否正确。"
-        elif e.code == 1310213:  # Permission error
-            error_message = "没有读取权限。请检查电子表格权限设置或联系文档所有者。"
-        elif e.code == 1310216:  # Range format error
-            error_message = "范围格式无效。请使用正确的格式，如 'A1:B10'。"
-        elif e.code == 1310219:  # Invalid regex pattern
-            error_message = "正则表达式格式无效。请检查正则表达式语法。"
-        elif e.is_authentication_error():
-            error_message = "认证失败。请检查app_id和app_secret配置。"
-        else:
-            error_message = e.message
+        error_message = _friendly_error_message(e, _FIND_CELLS_ERRORS) or e.message
 
         # Return error as dict instead of raising exception
         return {
@@ -718,10 +664,6 @@ async def find_cells(
         }
     except Exception as e:
         # Log the full exception for debugging
-        import logging
-        import traceback
-
-        logger = logging.getLogger(__name__)
         logger.error(f"Exception in find_cells: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
 
@@ -189,7 +189,7 @@ class TestFeishuAPIClient:
         # Verify request parameters
         call_args = mock_session.request.call_args
         assert call_args[1]["params"] == params
-        assert call_args[1]["data"] == json.dumps(data)
+        assert json.loads(call_args[1]["data"]) == data
 
     @pytest.mark.asyncio
     async def test_make_request_http_error(self):
@@ -283,6 +283,35 @@ class TestFeishuAPIClient:
         assert "Invalid JSON response" in error.message
         assert error.http_status == 200
 
+    @pytest.mark.asyncio
+    async def test_make_request_without_orjson(self):
+        """Test request encoding and response parsing fall back to stdlib json."""
+        auth_manager = Mock(spec=AuthenticationManager)
+        auth_manager.get_tenant_access_token = AsyncMock(return_value="test_token")
+
+        mock_response_data = {"code": 0, "msg": "success", "data": {"名称": "表格"}}
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value=json.dumps(mock_response_data))
+        mock_response.headers = {}
+
+        mock_session = Mock()
+        mock_context_manager = AsyncMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
+        mock_session.request = Mock(return_value=mock_context_manager)
+
+        client = FeishuAPIClient(auth_manager)
+        client.session = mock_session
+
+        with patch("src.services.api_client.orjson", None):
+            result = await client._make_request(
+                "POST", "/test/endpoint", data={"test": "value"}
+            )
+
+        assert result == mock_response_data
+        assert mock_session.request.call_args[1]["data"] == json.dumps({"test": "value"})
+
     @pytest.mark.asyncio
     async def test_make_request_network_error(self):
         """Test HTTP request with network error."""
@@ -634,7 +663,7 @@ class TestFeishuAPIClient:
             },
             "find": "test",
         }
-        assert call_args[1]["data"] == json.dumps(expected_data)
+        assert json.loads(call_args[1]["data"]) == expected_data
 
     @pytest.mark.asyncio
     async def test_find_cells_missing_range_spec(self):
@@ -747,6 +776,22 @@ class TestRateLimiter:
         # Should only have 1 request (the recent one)
         assert len(limiter.requests) == 1
 
+    @pytest.mark.asyncio
+    async def test_acquire_concurrent_waiters_queue_in_order(self):
+        """Test that concurrent callers over the limit wait without deadlocking."""
+        limiter = RateLimiter(max_requests=2, time_window=0.2)
+
+        start_time = time.time()
+        await asyncio.wait_for(
+            asyncio.gather(*(limiter.acquire() for _ in range(5))), timeout=2
+        )
+        elapsed = time.time() - start_time
+
+        # Requests 3-4 wait one window and request 5 waits two windows
+        assert 0.35 <= elapsed < 1.0
+        assert len(limiter.requests) == 5
+        assert limiter.requests == sorted(limiter.requests)
+
     def test_get_current_usage_empty(self):
         """Test getting usage statistics when no requests made."""
         limiter = RateLimiter(max_requests=100, time_window=60.0)
@@ -818,6 +863,34 @@ class TestFeishuAPIClientRateLimit:
         
         assert isinstance(client.rate_limiter, RateLimiter)
         assert isinstance(client.retry_strategy, RetryStrategy)
+        assert client.timeout == 30.0
+
+    @pytest.mark.asyncio
+    async def test_session_uses_configured_timeout(self):
+        """Test that the HTTP session honours the configured request timeout."""
+        auth_manager = Mock(spec=AuthenticationManager)
+        client = FeishuAPIClient(auth_manager, timeout=5)
+
+        session = await client._get_session()
+
+        assert session.timeout.total == 5
+
+        # Cleanup
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_session_keeps_connections_alive(self):
+        """Test that the shared session keeps idle connections for reuse."""
+        auth_manager = Mock(spec=AuthenticationManager)
+        client = FeishuAPIClient(auth_manager)
+
+        session = await client._get_session()
+
+        assert session.connector.limit_per_host == 30
+        assert session.connector._keepalive_timeout == 75
+
+        # Cleanup
+        await client.close()
 
     def test_get_rate_limiter_stats(self):
         """Test getting rate limiter statistics."""
@@ -856,7 +929,9 @@ class TestFeishuAPIClientRateLimit:
         
         assert result == mock_response_data
         rate_limiter.acquire.assert_called_once()
-        client._make_request.assert_called_once_with("GET", "/test", None, None, None)
+        client._make_request.assert_called_once_with(
+            "GET", "/test", None, None, None, "test_token"
+        )
 
     @pytest.mark.asyncio
     async def test_make_request_with_retry_retryable_error(self):
@@ -920,7 +995,7 @@ class TestFeishuAPIClientRateLimit:
             result = await client._make_request_with_retry("GET", "/test")
         
         assert result == mock_success
-        auth_manager.refresh_token.assert_called_once()
+        auth_manager.refresh_token.assert_called_once_with(rejected_token="test_token")
         mock_sleep.assert_called_once()
 
     @pytest.mark.asyncio
@@ -2,6 +2,7 @@
 Tests for authentication manager.
 """
 
+import asyncio
 import json
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
@@ -28,6 +29,7 @@ class TestAuthenticationManager:
         assert auth_manager.app_secret == "test_app_secret"
         assert auth_manager.tenant_access_token is None
         assert auth_manager.token_expires_at is None
+        assert auth_manager.timeout == 30.0
 
     def test_is_token_expired_no_token(self):
         """Test token expiration check when no token exists."""
@@ -122,6 +124,106 @@ class TestAuthenticationManager:
             # All calls should return the same token
             assert all(token == "token_1" for token in results)
 
+    @pytest.mark.asyncio
+    async def test_get_tenant_access_token_waits_for_forced_refresh(self):
+        """Test callers during a forced refresh get the new token, not the rejected one."""
+        auth_manager = AuthenticationManager("test_app_id", "test_app_secret")
+        auth_manager.tenant_access_token = "rejected_token"
+        auth_manager.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        refresh_started = asyncio.Event()
+        release_refresh = asyncio.Event()
+        refresh_call_count = 0
+
+        async def mock_refresh():
+            nonlocal refresh_call_count
+            refresh_call_count += 1
+            refresh_started.set()
+            await release_refresh.wait()
+            auth_manager.tenant_access_token = "new_token"
+            auth_manager.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        with patch.object(auth_manager, "_refresh_token", side_effect=mock_refresh):
+            refresh_task = asyncio.create_task(
+                auth_manager.refresh_token(rejected_token="rejected_token")
+            )
+            await refresh_started.wait()
+
+            callers = asyncio.gather(
+                *(auth_manager.get_tenant_access_token() for _ in range(4))
+            )
+            await asyncio.sleep(0)
+            release_refresh.set()
+
+            tokens = await callers
+            await refresh_task
+
+        assert tokens == ["new_token"] * 4
+        assert refresh_call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_tenant_access_token_valid_no_refresh(self):
+        """Test a valid token is returned without refreshing when idle."""
+        auth_manager = AuthenticationManager("test_app_id", "test_app_secret")
+        auth_manager.tenant_access_token = "valid_token"
+        auth_manager.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        with patch.object(
+            auth_manager, "_refresh_token", new_callable=AsyncMock
+        ) as mock_refresh:
+            token = await auth_manager.get_tenant_access_token()
+
+        assert token == "valid_token"
+        mock_refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_concurrent_calls_coalesce(self):
+        """Test concurrent forced refreshes share a single token refresh."""
+        auth_manager = AuthenticationManager("test_app_id", "test_app_secret")
+        auth_manager.tenant_access_token = "rejected_token"
+        auth_manager.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        refresh_call_count = 0
+
+        async def mock_refresh():
+            nonlocal refresh_call_count
+            refresh_call_count += 1
+            # Yield like a real network call so the other callers queue up
+            await asyncio.sleep(0)
+            auth_manager.tenant_access_token = f"token_{refresh_call_count}"
+            auth_manager.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        with patch.object(auth_manager, "_refresh_token", side_effect=mock_refresh):
+            await asyncio.gather(
+                auth_manager.refresh_token(),
+                auth_manager.refresh_token(),
+                auth_manager.refresh_token(),
+            )
+
+            assert refresh_call_count == 1
+            assert auth_manager.tenant_access_token == "token_1"
+
+            # A later forced refresh still goes to the server
+            await auth_manager.refresh_token()
+            assert refresh_call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_skips_when_rejected_token_already_replaced(self):
+        """Test a late caller reporting an old rejected token does not refresh again."""
+        auth_manager = AuthenticationManager("test_app_id", "test_app_secret")
+        auth_manager.tenant_access_token = "new_token"
+        auth_manager.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        with patch.object(
+            auth_manager, "_refresh_token", new_callable=AsyncMock
+        ) as mock_refresh:
+            await auth_manager.refresh_token(rejected_token="old_token")
+            mock_refresh.assert_not_called()
+
+            # The current token being rejected still forces a refresh
+            await auth_manager.refresh_token(rejected_token="new_token")
+            mock_refresh.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_refresh_token_success(self):
         """Test successful token refresh."""
@@ -149,6 +251,32 @@ class TestAuthenticationManager:
             time_diff = auth_manager.token_expires_at - datetime.now()
             assert 7190 <= time_diff.total_seconds() <= 7200
 
+    @pytest.mark.asyncio
+    async def test_refresh_token_uses_configured_timeout(self):
+        """Test the token request honours the configured timeout."""
+        auth_manager = AuthenticationManager(
+            "test_app_id", "test_app_secret", timeout=5
+        )
+
+        mock_response_data = {
+            "code": 0,
+            "msg": "ok",
+            "tenant_access_token": "t-test_token_123",
+            "expire": 7200,
+        }
+
+        with patch("aiohttp.ClientSession.post") as mock_post:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.json = AsyncMock(return_value=mock_response_data)
+            mock_post.return_value.__aenter__.return_value = mock_response
+
+            await auth_manager._refresh_token()
+
+            assert mock_post.call_args[1]["timeout"].total == 5
+
+        await auth_manager.close()
+
     @pytest.mark.asyncio
     async def test_refresh_token_api_error(self):
         """Test token refresh with API error response."""
@@ -430,3 +558,33 @@ class TestAuthenticationManager:
                 assert (
                     "Token refresh failed after all retries" in exc_info.value.message
                 )
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_reuses_session(self):
+        """Test that repeated token refreshes share one HTTP session."""
+        auth_manager = AuthenticationManager("test_app_id", "test_app_secret")
+
+        mock_response_data = {
+            "code": 0,
+            "msg": "ok",
+            "tenant_access_token": "t-test_token_123",
+            "expire": 7200,
+        }
+
+        with patch("aiohttp.ClientSession.post") as mock_post:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.json = AsyncMock(return_value=mock_response_data)
+            mock_post.return_value.__aenter__.return_value = mock_response
+
+            await auth_manager._refresh_token()
+            first_session = auth_manager.session
+            await auth_manager._refresh_token()
+
+            assert first_session is not None
+            assert auth_manager.session is first_session
+            assert mock_post.call_count == 2
+
+        await auth_manager.close()
+        assert auth_manager.session is None
+        assert first_session.closed
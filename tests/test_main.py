@@ -3,11 +3,12 @@ Tests for main entry point.
 """
 
 import os
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.main import main, main_async
+from src.main import _install_uvloop, main, main_async
 
 
 class TestMainAsync:
@@ -143,4 +144,29 @@ class TestMain:
 
         main()
 
-        mock_exit.assert_called_once_with(0)
\ No newline at end of file
+        mock_exit.assert_called_once_with(0)
+
+
+class TestInstallUvloop:
+    """Test optional uvloop event loop setup."""
+
+    def test_install_uvloop_missing(self):
+        """Test that the default event loop is kept when uvloop is unavailable."""
+        with patch.dict(sys.modules, {"uvloop": None}), patch(
+            "src.main.asyncio.set_event_loop_policy"
+        ) as mock_set_policy:
+            assert _install_uvloop() is False
+
+        mock_set_policy.assert_not_called()
+
+    def test_install_uvloop_available(self):
+        """Test that the uvloop policy is installed when uvloop is importable."""
+        mock_uvloop = MagicMock()
+        with patch.dict(sys.modules, {"uvloop": mock_uvloop}), patch(
+            "src.main.asyncio.set_event_loop_policy"
+        ) as mock_set_policy:
+            assert _install_uvloop() is True
+
+        mock_set_policy.assert_called_once_with(
+            mock_uvloop.EventLoopPolicy.return_value
+        )
@@ -22,6 +22,15 @@ class TestFeishuSpreadsheetMCPServer:
         assert isinstance(server.api_client, FeishuAPIClient)
         assert server.mcp.name == "feishu-spreadsheet-mcp"
 
+    def test_init_passes_timeout(self):
+        """Test the configured timeout reaches both auth and API clients."""
+        server = FeishuSpreadsheetMCPServer(
+            "test_app_id", "test_app_secret", timeout=5
+        )
+
+        assert server.auth_manager.timeout == 5
+        assert server.api_client.timeout == 5
+
     def test_get_mcp_server(self):
         """Test getting FastMCP instance."""
         server = FeishuSpreadsheetMCPServer("test_app_id", "test_app_secret")
@@ -42,59 +51,6 @@ class TestFeishuSpreadsheetMCPServer:
         
         server.api_client.close.assert_called_once()
 
-    def test_pydantic_models(self):
-        """Test that Pydantic models are properly defined."""
-        from src.server import (
-            ListSpreadsheetsArgs,
-            GetWorksheetsArgs,
-            ReadRangeArgs,
-            ReadMultipleRangesArgs,
-            FindCellsArgs,
-        )
-
-        # Test ListSpreadsheetsArgs
-        args = ListSpreadsheetsArgs()
-        assert args.folder_token is None
-        assert args.page_size == 50
-
-        args_with_data = ListSpreadsheetsArgs(folder_token="test", page_size=10)
-        assert args_with_data.folder_token == "test"
-        assert args_with_data.page_size == 10
-
-        # Test GetWorksheetsArgs
-        worksheet_args = GetWorksheetsArgs(spreadsheet_token="test_token")
-        assert worksheet_args.spreadsheet_token == "test_token"
-
-        # Test ReadRangeArgs
-        range_args = ReadRangeArgs(spreadsheet_token="test", range_spec="A1:B2")
-        assert range_args.spreadsheet_token == "test"
-        assert range_args.range_spec == "A1:B2"
-        assert range_args.value_render_option == "UnformattedValue"
-        assert range_args.date_time_render_option == "FormattedString"
-
-        # Test ReadMultipleRangesArgs
-        multi_args = ReadMultipleRangesArgs(
-            spreadsheet_token="test", ranges=["A1:B2", "C1:D2"]
-        )
-        assert multi_args.spreadsheet_token == "test"
-        assert multi_args.ranges == ["A1:B2", "C1:D2"]
-
-        # Test FindCellsArgs
-        find_args = FindCellsArgs(
-            spreadsheet_token="test",
-            sheet_id="sheet1",
-            range_spec="A1:B2",
-            find_text="search",
-        )
-        assert find_args.spreadsheet_token == "test"
-        assert find_args.sheet_id == "sheet1"
-        assert find_args.range_spec == "A1:B2"
-        assert find_args.find_text == "search"
-        assert find_args.match_case is False
-        assert find_args.match_entire_cell is False
-        assert find_args.search_by_regex is False
-        assert find_args.include_formulas is False
-
     @pytest.mark.asyncio
     async def test_tool_functions(self):
         """Test that tool functions can be called with proper arguments."""
@@ -157,99 +113,3 @@ class TestFeishuSpreadsheetMCPServer:
         server.api_client.close = AsyncMock()
         await server.close()
         server.api_client.close.assert_called_once()
-
-
-class TestPydanticModels:
-    """Test Pydantic models separately."""
-
-    def test_list_spreadsheets_args_validation(self):
-        """Test ListSpreadsheetsArgs validation."""
-        from src.server import ListSpreadsheetsArgs
-        from pydantic import ValidationError
-        
-        # Valid cases
-        args1 = ListSpreadsheetsArgs()
-        assert args1.page_size == 50
-        
-        args2 = ListSpreadsheetsArgs(page_size=100)
-        assert args2.page_size == 100
-        
-        args3 = ListSpreadsheetsArgs(folder_token="test")
-        assert args3.folder_token == "test"
-        
-        # Invalid page_size (should be int)
-        with pytest.raises(ValidationError):
-            ListSpreadsheetsArgs(page_size="not_int")
-
-    def test_get_worksheets_args_validation(self):
-        """Test GetWorksheetsArgs validation."""
-        from src.server import GetWorksheetsArgs
-        from pydantic import ValidationError
-        
-        # Valid case
-        args = GetWorksheetsArgs(spreadsheet_token="token123")
-        assert args.spreadsheet_token == "token123"
-        
-        # Missing required field
-        with pytest.raises(ValidationError):
-            GetWorksheetsArgs()
-
-    def test_read_range_args_validation(self):
-        """Test ReadRangeArgs validation."""
-        from src.server import ReadRangeArgs
-        from pydantic import ValidationError
-        
-        # Valid case
-        args = ReadRangeArgs(spreadsheet_token="token", range_spec="A1:B2")
-        assert args.spreadsheet_token == "token"
-        assert args.range_spec == "A1:B2"
-        
-        # Missing required fields
-        with pytest.raises(ValidationError):
-            ReadRangeArgs(spreadsheet_token="token")  # Missing range_spec
-        
-        with pytest.raises(ValidationError):
-            ReadRangeArgs(range_spec="A1:B2")  # Missing spreadsheet_token
-
-    def test_find_cells_args_validation(self):
-        """Test FindCellsArgs validation."""
-        from src.server import FindCellsArgs
-        from pydantic import ValidationError
-        
-        # Valid case
-        args = FindCellsArgs(
-            spreadsheet_token="token",
-            sheet_id="sheet1",
-            range_spec="A1:B2",
-            find_text="test"
-        )
-        assert args.spreadsheet_token == "token"
-        assert args.sheet_id == "sheet1"
-        assert args.range_spec == "A1:B2"
-        assert args.find_text == "test"
-        
-        # Test boolean defaults
-        assert args.match_case is False
-        assert args.match_entire_cell is False
-        assert args.search_by_regex is False
-        assert args.include_formulas is False
-        
-        # Test with custom boolean values
-        args_custom = FindCellsArgs(
-            spreadsheet_token="token",
-            sheet_id="sheet1",
-            range_spec="A1:B2",
-            find_text="test",
-            match_case=True,
-            search_by_regex=True
-        )
-        assert args_custom.match_case is True
-        assert args_custom.search_by_regex is True
-        
-        # Missing required fields
-        with pytest.raises(ValidationError):
-            FindCellsArgs(
-                sheet_id="sheet1",
-                range_spec="A1:B2",
-                find_text="test"
-            )  # Missing spreadsheet_token
\ No newline at end of file
@@ -2,6 +2,7 @@
 Tests for spreadsheet tools.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
@@ -15,6 +16,10 @@ from src.tools import (
     read_multiple_ranges,
     read_range,
 )
+from src.tools.spreadsheet_tools import (
+    MAX_CONCURRENT_RANGE_READS,
+    _compile_search_pattern,
+)
 
 
 class TestListSpreadsheetsFunction:
@@ -1307,6 +1312,64 @@ class TestReadMultipleRangesFunction:
         # Should log warning for invalid data
         assert "Skipping invalid range data at index 1" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_read_multiple_ranges_reads_concurrently(self, mock_api_client):
+        """Test that ranges are read concurrently and results keep input order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_read_range(spreadsheet_token, range_spec, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if range_spec == "sheet123!C1:D2":
+                raise FeishuAPIError(code=1310215, message="Not found", http_status=404)
+            return {
+                "data": {
+                    "valueRange": {
+                        "range": range_spec,
+                        "majorDimension": "ROWS",
+                        "values": [[range_spec]],
+                        "revision": 1,
+                    }
+                }
+            }
+
+        mock_api_client.read_range.side_effect = fake_read_range
+        ranges = ["sheet123!A1:B2", "sheet123!C1:D2", "sheet123!E1:F2"]
+
+        result = await read_multiple_ranges(mock_api_client, "test_token", ranges)
+
+        assert max_in_flight == 3
+        assert [r["range"] for r in result["ranges"]] == ranges
+        assert result["ranges"][0]["values"] == [["sheet123!A1:B2"]]
+        assert result["ranges"][1]["is_empty"] is True
+        assert result["ranges"][2]["values"] == [["sheet123!E1:F2"]]
+
+    @pytest.mark.asyncio
+    async def test_read_multiple_ranges_limits_concurrency(self, mock_api_client):
+        """Test that concurrent range reads are capped."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_read_range(spreadsheet_token, range_spec, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"data": {"valueRange": {"range": range_spec, "values": []}}}
+
+        mock_api_client.read_range.side_effect = fake_read_range
+        ranges = [f"sheet123!A{i}:B{i}" for i in range(1, 21)]
+
+        result = await read_multiple_ranges(mock_api_client, "test_token", ranges)
+
+        assert max_in_flight == MAX_CONCURRENT_RANGE_READS
+        assert [r["range"] for r in result["ranges"]] == ranges
+
 
 class TestFindCellsFunction:
     """Test find_cells function."""
@@ -1657,6 +1720,46 @@ class TestFindCellsFunction:
         assert exc_info.value.code == -1
         assert "查找单元格时发生错误" in exc_info.value.message
 
+    @pytest.mark.asyncio
+    async def test_find_cells_regex_search_compiles_once(self, mock_api_client):
+        """Test regex search matches locally and reuses the compiled pattern."""
+        mock_api_client.read_range.return_value = {
+            "data": {
+                "valueRange": {
+                    "range": "sheet123!A1:B2",
+                    "majorDimension": "ROWS",
+                    "values": [["Item 1", "note"], [None, "ITEM 22"]],
+                    "revision": 1,
+                }
+            }
+        }
+
+        _compile_search_pattern.cache_clear()
+
+        result = await find_cells(
+            mock_api_client,
+            "test_token",
+            "sheet123",
+            "A1:B2",
+            r"item \d+$",
+            search_by_regex=True,
+        )
+
+        assert result["matched_cells"] == ["A1", "B2"]
+        assert result["rows_count"] == 2
+        assert _compile_search_pattern.cache_info().misses == 1
+
+        # Repeating the search reuses the cached pattern
+        await find_cells(
+            mock_api_client,
+            "test_token",
+            "sheet123",
+            "A1:B2",
+            r"item \d+$",
+            search_by_regex=True,
+        )
+        assert _compile_search_pattern.cache_info().misses == 1
+
 
 class TestSpreadsheetToolsOther:
     """Test other spreadsheet tool functions."""